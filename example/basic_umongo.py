@@ -1,3 +1,4 @@
+import asyncio
 import secrets
 import string
 
@@ -137,32 +138,41 @@ def create_app() -> Sanic:
         """Create a bunch of test users for examples"""
         await User.ensure_indexes()
 
-        await User(
-            username="the_dude",
-            email="the_dude@beskar.test.io",
-            password=_guard.hash_password("abides"),
-        ).commit()
-
-        await User(
-            username="Walter",
-            email="walter@beskar.test.io",
-            password=_guard.hash_password("calmerthanyouare"),
-            roles="admin",
-        ).commit()
-
-        await User(
-            username="Donnie",
-            email="donnie@beskar.test.io",
-            password=_guard.hash_password("iamthewalrus"),
-            roles="operator",
-        ).commit()
-
-        await User(
-            username="Maude",
-            password=_guard.hash_password("andthorough"),
-            email="maude@beskar.test.io",
-            roles="operator,admin",
-        ).commit()
+        users = [
+            dict(
+                username="the_dude",
+                email="the_dude@beskar.test.io",
+                password="abides",
+            ),
+            dict(
+                username="Walter",
+                email="walter@beskar.test.io",
+                password="calmerthanyouare",
+                roles="admin",
+            ),
+            dict(
+                username="Donnie",
+                email="donnie@beskar.test.io",
+                password="iamthewalrus",
+                roles="operator",
+            ),
+            dict(
+                username="Maude",
+                password="andthorough",
+                email="maude@beskar.test.io",
+                roles="operator,admin",
+            ),
+        ]
+
+        # Hash the passwords in parallel, off of the event loop
+        loop = asyncio.get_running_loop()
+        hashes = await asyncio.gather(
+            *[loop.run_in_executor(None, _guard.hash_password, u["password"]) for u in users]
+        )
+        # umongo has no bulk insert, so at least commit them concurrently
+        await asyncio.gather(
+            *[User(**{**u, "password": h}).commit() for (u, h) in zip(users, hashes)]
+        )
 
     # Set up some routes for the example
     @sanic_app.route("/login", methods=["POST"])
@@ -1,3 +1,4 @@
+import asyncio
 import secrets
 import string
 
@@ -167,32 +168,38 @@ def create_app() -> Sanic:
     @sanic_app.listener("before_server_start")
     async def populate_db(*args):
         """Create a bunch of test users for examples"""
-        await User.create(
-            username="the_dude",
-            email="the_dude@beskar.test.io",
-            password=_guard.hash_password("abides"),
-        )
-
-        await User.create(
-            username="Walter",
-            email="walter@beskar.test.io",
-            password=_guard.hash_password("calmerthanyouare"),
-            roles="admin",
-        )
-
-        await User.create(
-            username="Donnie",
-            email="donnie@beskar.test.io",
-            password=_guard.hash_password("iamthewalrus"),
-            roles="operator",
-        )
-
-        await User.create(
-            username="Maude",
-            password=_guard.hash_password("andthorough"),
-            email="maude@beskar.test.io",
-            roles="operator,admin",
+        users = [
+            dict(
+                username="the_dude",
+                email="the_dude@beskar.test.io",
+                password="abides",
+            ),
+            dict(
+                username="Walter",
+                email="walter@beskar.test.io",
+                password="calmerthanyouare",
+                roles="admin",
+            ),
+            dict(
+                username="Donnie",
+                email="donnie@beskar.test.io",
+                password="iamthewalrus",
+                roles="operator",
+            ),
+            dict(
+                username="Maude",
+                password="andthorough",
+                email="maude@beskar.test.io",
+                roles="operator,admin",
+            ),
+        ]
+
+        # Hash the passwords in parallel, off of the event loop
+        loop = asyncio.get_running_loop()
+        hashes = await asyncio.gather(
+            *[loop.run_in_executor(None, _guard.hash_password, u["password"]) for u in users]
         )
+        await User.bulk_create([User(**{**u, "password": h}) for (u, h) in zip(users, hashes)])
 
     # Set up some routes for the example
     @sanic_app.route("/login", methods=["POST"])
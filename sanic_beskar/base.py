@@ -12,7 +12,6 @@ import aiofiles
 import jinja2
 import jwt
 import pendulum
-import ujson
 from passlib.context import CryptContext
 from passlib.totp import TOTP
 from sanic import Request, Sanic
@@ -27,6 +26,7 @@ from sanic_beskar.constants import (
     DEFAULT_HASH_AUTOUPDATE,
     DEFAULT_HASH_DEPRECATED_SCHEMES,
     DEFAULT_HASH_SCHEME,
+    DEFAULT_HASH_SETTINGS,
     DEFAULT_JWT_ALGORITHM,
     DEFAULT_JWT_ALLOWED_ALGORITHMS,
     DEFAULT_PASETO_VERSION,
@@ -35,6 +35,9 @@ from sanic_beskar.constants import (
     DEFAULT_RESET_TEMPLATE,
     DEFAULT_ROLES_DISABLED,
     DEFAULT_TOKEN_ACCESS_LIFESPAN,
+    DEFAULT_TOKEN_CACHE_ENABLED,
+    DEFAULT_TOKEN_CACHE_SIZE,
+    DEFAULT_TOKEN_CACHE_TTL,
     DEFAULT_TOKEN_COOKIE_NAME,
     DEFAULT_TOKEN_HEADER_NAME,
     DEFAULT_TOKEN_HEADER_TYPE,
@@ -76,15 +79,20 @@ from sanic_beskar.exceptions import (
 )
 from sanic_beskar.utilities import (
     JSONEncoder,
+    SerializerPyJWT,
+    TokenCache,
     duration_from_string,
     get_request,
     is_valid_json,
+    json_serializer,
     normalize_rbac,
 )
 
 if TYPE_CHECKING:
     from pyseto import KeyInterface, Paseto, Token
 
+_pyjwt = SerializerPyJWT()
+
 
 class Beskar:
     """
@@ -114,6 +122,7 @@ class Beskar:
         self.paseto_key: Union[bytes, str]
         self.paseto_token: "Token"
         self.rbac_definitions: dict = {}
+        self.token_cache: Optional[TokenCache] = None
 
         if app is not None and user_class is not None:
             self.init_app(
@@ -185,11 +194,17 @@ class Beskar:
             DEFAULT_HASH_AUTOTEST,
         )
 
+        hash_schemes = app.config.get(
+            "BESKAR_HASH_ALLOWED_SCHEMES",
+            DEFAULT_HASH_ALLOWED_SCHEMES,
+        )
+        hash_settings = {
+            **DEFAULT_HASH_SETTINGS,
+            **app.config.get("BESKAR_HASH_SETTINGS", {}),
+        }
+
         self.pwd_ctx = CryptContext(
-            schemes=app.config.get(
-                "BESKAR_HASH_ALLOWED_SCHEMES",
-                DEFAULT_HASH_ALLOWED_SCHEMES,
-            ),
+            schemes=hash_schemes,
             default=app.config.get(
                 "BESKAR_HASH_SCHEME",
                 DEFAULT_HASH_SCHEME,
@@ -198,6 +213,12 @@ class Beskar:
                 "BESKAR_HASH_DEPRECATED_SCHEMES",
                 DEFAULT_HASH_DEPRECATED_SCHEMES,
             ),
+            # Only hand passlib the settings for schemes it actually has loaded
+            **{
+                k: v
+                for (k, v) in hash_settings.items()
+                if k.partition("__")[0] in (*hash_schemes, "all")
+            },
         )
 
         if self.pwd_ctx.default_scheme().startswith("pbkdf2_"):
@@ -298,6 +319,13 @@ class Beskar:
 
         self.is_testing = app.config.get("TESTING", False)
 
+        self.token_cache = None
+        if self.token_cache_enabled:
+            self.token_cache = TokenCache(
+                maxsize=self.token_cache_size,
+                ttl=self.token_cache_ttl,
+            )
+
         """
         If we are supporting RBAC, lets go pull the current, massage it, and store
         it.  Additionally, setup a listener to know when to go pull updated RBAC
@@ -456,6 +484,21 @@ class Beskar:
             self.encode_key,
         )
 
+        self.token_cache_enabled = self.app.config.get(
+            "BESKAR_TOKEN_CACHE_ENABLED",
+            DEFAULT_TOKEN_CACHE_ENABLED,
+        )
+
+        self.token_cache_size = self.app.config.get(
+            "BESKAR_TOKEN_CACHE_SIZE",
+            DEFAULT_TOKEN_CACHE_SIZE,
+        )
+
+        self.token_cache_ttl = self.app.config.get(
+            "BESKAR_TOKEN_CACHE_TTL",
+            DEFAULT_TOKEN_CACHE_TTL,
+        )
+
         self.password_policy = self.app.config.get(
             "BESKAR_PASSWORD_POLICY",
             DEFAULT_PASSWORD_POLICY,
@@ -706,10 +749,7 @@ class Beskar:
             user = user
 
         AuthenticationError.require_condition(
-            user is not None
-            and hasattr(user, "totp")
-            and user.totp
-            and await is_valid_json(user.totp),
+            user is not None and hasattr(user, "totp") and user.totp and is_valid_json(user.totp),
             "TOTP challenge is not properly configured for this user",
         )
         AuthenticationError.require_condition(
@@ -900,7 +940,7 @@ class Beskar:
         """
 
         ClaimCollisionError.require_condition(
-            set(custom_claims.keys()).isdisjoint(RESERVED_CLAIMS),
+            RESERVED_CLAIMS.isdisjoint(custom_claims),
             "The custom claims collide with required claims",
         )
         if not bypass_user_check:
@@ -948,7 +988,7 @@ class Beskar:
         return self.paseto_ctx.encode(
             self.paseto_parsed_keys,
             payload_parts,
-            serializer=ujson,
+            serializer=json_serializer,
             exp=time_delta,
         ).decode(
             "utf-8"
@@ -995,7 +1035,7 @@ class Beskar:
         """
 
         ClaimCollisionError.require_condition(
-            set(custom_claims.keys()).isdisjoint(RESERVED_CLAIMS),
+            RESERVED_CLAIMS.isdisjoint(custom_claims),
             "The custom claims collide with required claims",
         )
         if not bypass_user_check:
@@ -1212,7 +1252,7 @@ class Beskar:
         _token: bytes = self.paseto_ctx.encode(
             self.paseto_parsed_keys,
             payload_parts,
-            serializer=ujson,
+            serializer=json_serializer,
             exp=time_delta,
         )
 
@@ -1280,6 +1320,11 @@ class Beskar:
         function will automagically identify the token type based upon
         application configuration and process it accordingly.
 
+        If :py:data:`BESKAR_TOKEN_CACHE_ENABLED` is set, access tokens that
+        have already been verified are served from :py:attr:`token_cache`,
+        skipping signature verification. The cached claims are still run
+        through the usual validation (expiry, blacklist, etc) on every call.
+
         Args:
             token (str): Token to be processed
             access_type (AccessType): Type of token being processed
@@ -1287,10 +1332,20 @@ class Beskar:
         Returns:
             dict: Extracted token as a `dict`
         """
+        use_cache = self.token_cache is not None and access_type == AccessType.access
+        if use_cache:
+            _cached = self.token_cache.get(token)  # type: ignore
+            if _cached is not None:
+                self._validate_token_data(_cached, access_type=access_type)
+                return _cached
+
         _token: dict = await getattr(self, f"extract_{self.token_provider}_token")(
             token=token, access_type=access_type
         )
 
+        if use_cache:
+            self.token_cache.set(token, _token)  # type: ignore
+
         return _token
 
     async def extract_paseto_token(
@@ -1324,7 +1379,7 @@ class Beskar:
                 else:
                     t.payload = k.verify(t.payload, t.footer)
                 try:
-                    t.payload = ujson.loads(t.payload)
+                    t.payload = json_serializer.loads(t.payload)
                 except Exception as err:
                     raise InvalidTokenHeader("Failed to deserialize the payload.") from err
             except Exception as err:
@@ -1354,7 +1409,7 @@ class Beskar:
 
         # Note: we disable exp verification because we will do it ourselves
         with InvalidTokenHeader.handle_errors("failed to decode JWT token"):
-            data: dict = jwt.decode(
+            data: dict = _pyjwt.decode(
                 token,
                 self.encode_key,
                 algorithms=self.allowed_algorithms,
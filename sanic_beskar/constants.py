@@ -1,5 +1,6 @@
 import enum
 from os.path import abspath, dirname
+from typing import Optional
 
 from pendulum import Duration, duration
 
@@ -50,6 +51,13 @@ DEFAULT_HASH_ALLOWED_SCHEMES: list = [
     "bcrypt_sha256",
 ]
 DEFAULT_HASH_DEPRECATED_SCHEMES: list = []
+# OWASP baseline for interactive logins: Argon2id, m=64MiB, t=2, p=1
+DEFAULT_HASH_SETTINGS: dict = {
+    "argon2__type": "ID",
+    "argon2__time_cost": 2,
+    "argon2__memory_cost": 65536,
+    "argon2__parallelism": 1,
+}
 
 DEFAULT_TOTP_ENFORCE: bool = True
 DEFAULT_TOTP_SECRETS_TYPE: str = ""
@@ -58,19 +66,25 @@ DEFAULT_TOTP_SECRETS_DATA: str = ""
 DEFAULT_TOKEN_PROVIDER: str = "jwt"  # jwt|paseto
 DEFAULT_PASETO_VERSION: int = 4  # 1|2|3|4
 
+DEFAULT_TOKEN_CACHE_ENABLED: bool = False
+DEFAULT_TOKEN_CACHE_SIZE: int = 1024
+DEFAULT_TOKEN_CACHE_TTL: Optional[int] = None
+
 REFRESH_EXPIRATION_CLAIM: str = "rf_exp"
 IS_REGISTRATION_TOKEN_CLAIM: str = "is_ert"
 IS_RESET_TOKEN_CLAIM: str = "is_prt"
-RESERVED_CLAIMS = {
-    "iat",
-    "exp",
-    "jti",
-    "id",
-    "rls",
-    REFRESH_EXPIRATION_CLAIM,
-    IS_REGISTRATION_TOKEN_CLAIM,
-    IS_RESET_TOKEN_CLAIM,
-}
+RESERVED_CLAIMS: frozenset = frozenset(
+    {
+        "iat",
+        "exp",
+        "jti",
+        "id",
+        "rls",
+        REFRESH_EXPIRATION_CLAIM,
+        IS_REGISTRATION_TOKEN_CLAIM,
+        IS_RESET_TOKEN_CLAIM,
+    }
+)
 
 # 1M days seems reasonable. If this code is being used in 3000 years...whelp
 VITAM_AETERNUM: Duration = duration(days=1000000)
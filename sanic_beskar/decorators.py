@@ -14,13 +14,12 @@ from sanic_beskar.utilities import (
     app_context_has_token_data,
     current_guard,
     current_rolenames,
-    remove_token_data_from_app_context,
 )
 
 
 async def _verify_and_add_token(request: Request, optional: bool = False) -> None:
     """
-    This helper method just checks and adds token data to the app context.
+    This helper method just checks and adds token data to the request context.
     If optional is False and the header is missing the token, just returns.
 
     Will not add token data if it is already present.
@@ -34,8 +33,8 @@ async def _verify_and_add_token(request: Request, optional: bool = False) -> Non
     Raises:
         MissingToken: Token is required and not present.
     """
-    if not app_context_has_token_data():
-        guard = current_guard()
+    if not app_context_has_token_data(request):
+        guard = current_guard(request.app)
         try:
             token = guard.read_token(request=request)
         except MissingToken as err:
@@ -43,7 +42,7 @@ async def _verify_and_add_token(request: Request, optional: bool = False) -> Non
                 return
             raise err
         token_data = await guard.extract_token(token)
-        add_token_data_to_app_context(token_data)
+        add_token_data_to_app_context(token_data, request)
 
 
 def auth_required(method: Callable) -> Callable[..., Any]:
@@ -82,10 +81,7 @@ def auth_required(method: Callable) -> Callable[..., Any]:
             if isinstance(args[0], Request):
                 request = args[0]
         await _verify_and_add_token(request=request)
-        try:
-            return await method(request, *args, **kwargs)
-        finally:
-            remove_token_data_from_app_context()
+        return await method(request, *args, **kwargs)
 
     return wrapper
 
@@ -118,11 +114,8 @@ def auth_accepted(method: Callable) -> Callable[..., Any]:
         if not isinstance(request, Request):
             if isinstance(args[0], Request):
                 request = args[0]
-        try:
-            await _verify_and_add_token(request, optional=True)
-            return await method(request, *args, **kwargs)
-        finally:
-            remove_token_data_from_app_context()
+        await _verify_and_add_token(request, optional=True)
+        return await method(request, *args, **kwargs)
 
     return wrapper
 
@@ -142,6 +135,9 @@ def roles_required(*required_rolenames: Union[list, set]) -> Callable[..., Any]:
         None: Decorator
     """
 
+    # Built once per decorated route, rather than on every request
+    required_roles = frozenset(required_rolenames)
+
     def decorator(method: Callable) -> Callable:
         """decorator"""
 
@@ -167,23 +163,20 @@ def roles_required(*required_rolenames: Union[list, set]) -> Callable[..., Any]:
                 MissingTokenError: Token missing in ``Sanic.Request``
             """
 
-            BeskarError.require_condition(
-                not current_guard().roles_disabled,
-                "This feature is not available because roles are disabled",
-            )
             # TODO: hack to work around class based views
             if not isinstance(request, Request):
                 if isinstance(args[0], Request):
                     request = args[0]
+            BeskarError.require_condition(
+                not current_guard(request.app).roles_disabled,
+                "This feature is not available because roles are disabled",
+            )
             await _verify_and_add_token(request)
-            try:
-                MissingRoleError.require_condition(
-                    not {*required_rolenames} - {*(await current_rolenames())},
-                    "This endpoint requires all the following roles: " f"[{required_rolenames}]",
-                )
-                return await method(request, *args, **kwargs)
-            finally:
-                remove_token_data_from_app_context()
+            MissingRoleError.require_condition(
+                required_roles <= await current_rolenames(request),
+                "This endpoint requires all the following roles: " f"[{required_rolenames}]",
+            )
+            return await method(request, *args, **kwargs)
 
         return wrapper
 
@@ -228,32 +221,27 @@ def rights_required(*required_rights: Union[list, set]) -> Callable[..., Any]:
             Raises:
                 MissingRightError: Missing required rights in user ``rbac`` attribute breakdown.
             """
-            BeskarError.require_condition(
-                current_guard().rbac_definitions != {},
-                "This feature is not available because RBAC is not enabled",
-            )
             # TODO: hack to work around class based views
             if not isinstance(request, Request):
                 if isinstance(args[0], Request):
                     request = args[0]
+            rbac_definitions = current_guard(request.app).rbac_definitions
+            BeskarError.require_condition(
+                rbac_definitions != {},
+                "This feature is not available because RBAC is not enabled",
+            )
             await _verify_and_add_token(request)
-            try:
-                current_roles = await current_rolenames()
-                for right in required_rights:
-                    BeskarError.require_condition(
-                        right in current_guard().rbac_definitions,
-                        "This endpoint requires a right which is not otherwise defined: "
-                        f"[{right}]",
-                    )
-                    MissingRightError.require_condition(
-                        not {*current_roles}.isdisjoint(
-                            {*(current_guard().rbac_definitions[right])}
-                        ),
-                        "This endpoint requires all the following rights: " f"[{required_rights}]",
-                    )
-                return await method(request, *args, **kwargs)
-            finally:
-                remove_token_data_from_app_context()
+            current_roles = await current_rolenames(request)
+            for right in required_rights:
+                BeskarError.require_condition(
+                    right in rbac_definitions,
+                    "This endpoint requires a right which is not otherwise defined: " f"[{right}]",
+                )
+                MissingRightError.require_condition(
+                    not current_roles.isdisjoint(rbac_definitions[right]),
+                    "This endpoint requires all the following rights: " f"[{required_rights}]",
+                )
+            return await method(request, *args, **kwargs)
 
         return wrapper
 
@@ -275,6 +263,9 @@ def roles_accepted(*accepted_rolenames: Union[list, set]) -> Callable[..., Any]:
         None: Decorator
     """
 
+    # Built once per decorated route, rather than on every request
+    accepted_roles = frozenset(accepted_rolenames)
+
     def decorator(method: Callable) -> Callable[..., Any]:
         """decorator"""
 
@@ -297,23 +288,20 @@ def roles_accepted(*accepted_rolenames: Union[list, set]) -> Callable[..., Any]:
             Raises:
                 MissingRightError: Missing required rights in user ``roles`` attribute breakdown.
             """
-            BeskarError.require_condition(
-                not current_guard().roles_disabled,
-                "This feature is not available because roles are disabled",
-            )
             # TODO: hack to work around class based views
             if not isinstance(request, Request):
                 if isinstance(args[0], Request):
                     request = args[0]
+            BeskarError.require_condition(
+                not current_guard(request.app).roles_disabled,
+                "This feature is not available because roles are disabled",
+            )
             await _verify_and_add_token(request)
-            try:
-                MissingRoleError.require_condition(
-                    not {*(await current_rolenames())}.isdisjoint(accepted_rolenames),
-                    "This endpoint requires one of the following roles: " f"[{accepted_rolenames}]",
-                )
-                return await method(request, *args, **kwargs)
-            finally:
-                remove_token_data_from_app_context()
+            MissingRoleError.require_condition(
+                not accepted_roles.isdisjoint(await current_rolenames(request)),
+                "This endpoint requires one of the following roles: " f"[{accepted_rolenames}]",
+            )
+            return await method(request, *args, **kwargs)
 
         return wrapper
 
@@ -1,6 +1,9 @@
 import datetime as dt
 import re
+import time
+from collections import OrderedDict
 from collections.abc import Iterable
+from hashlib import blake2b
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any, Optional, Union
 
@@ -10,6 +13,12 @@ try:  # pragma: no cover
 except (ImportError, ModuleNotFoundError):  # pragma: no cover
     from bson.objectid import ObjectId  # type: ignore
 
+# If `orjson` is available, prefer it over `ujson` for (de)serializing token payloads
+try:  # pragma: no cover
+    import orjson as json_serializer
+except (ImportError, ModuleNotFoundError):  # pragma: no cover
+    import ujson as json_serializer  # type: ignore
+
 ## If we are using `segno`, import for typing
 if TYPE_CHECKING:
     from segno import QRCode
@@ -18,13 +27,32 @@ if TYPE_CHECKING:
 
 from json import JSONEncoder as json_JSONEncoder
 
+import jwt
 import pendulum
-import ujson
 from sanic import Request, Sanic
 
-from sanic_beskar.constants import RESERVED_CLAIMS
+from sanic_beskar.constants import (
+    DEFAULT_TOKEN_CACHE_SIZE,
+    DEFAULT_TOKEN_CACHE_TTL,
+    RESERVED_CLAIMS,
+)
 from sanic_beskar.exceptions import BeskarError, ConfigurationError
 
+_DURATION_RE = re.compile(
+    r"""
+        (?:(?P<years>\d+)y[a-z]*)?
+        (?:(?P<months>\d+)mo[a-z]*)?
+        (?:(?P<days>\d+)d[a-z]*)?
+        (?:(?P<hours>\d+)h[a-z]*)?
+        (?:(?P<minutes>\d+)m[a-z]*)?
+        (?:(?P<seconds>\d+)s[a-z]*)?
+    """,
+    re.VERBOSE,
+)
+
+# Returned when a token has no roles, so our set arithmetic works correctly
+_NO_ROLENAMES: frozenset = frozenset(["non-empty-but-definitely-not-matching-subset"])
+
 
 class JSONEncoder(json_JSONEncoder):  # pragma: no cover
     """JSON encoder class to facilitate serializing datetimes and ObjectId's"""
@@ -51,7 +79,103 @@ class JSONEncoder(json_JSONEncoder):  # pragma: no cover
         return JSONEncoder.default(self, o)
 
 
-def get_request(request: Request) -> Request:
+class SerializerPyJWT(jwt.PyJWT):
+    """
+    :py:class:`jwt.PyJWT` that parses token payloads with our preferred json
+    serializer (``orjson``, if available), rather than the stdlib ``json``
+    """
+
+    def _decode_payload(self, decoded: dict) -> Any:
+        """
+        Overrides PyJWT's ``_decode_payload`` hook (available since pyjwt 2.6),
+        parsing the payload with :py:data:`json_serializer`, and raising the same
+        errors PyJWT would for a bad payload
+        """
+        try:
+            payload = json_serializer.loads(decoded["payload"])
+        except (ValueError, RecursionError) as e:
+            raise jwt.DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+class TokenCache:
+    """
+    Small LRU cache of verified token payloads, keyed by a digest of the raw
+    token (the token itself is never stored). Entries are evicted once their
+    ``exp`` claim has passed, once they are older than :py:data:`ttl` seconds
+    (if set), or when the cache grows beyond :py:data:`maxsize`.
+
+    Only signature verification and deserialization are skipped on a hit; the
+    caller is still expected to validate the returned claims.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_TOKEN_CACHE_SIZE,
+        ttl: Optional[int] = DEFAULT_TOKEN_CACHE_TTL,
+    ) -> None:
+        self.maxsize: int = maxsize
+        self.ttl: Optional[int] = ttl
+        self._data: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        """number of tokens currently cached"""
+        return len(self._data)
+
+    @staticmethod
+    def _key(token: Union[bytes, str]) -> bytes:
+        """digest used as the cache key for a raw token"""
+        if isinstance(token, str):
+            token = token.encode()
+        return blake2b(token, digest_size=16).digest()
+
+    def get(self, token: Union[bytes, str]) -> Optional[dict]:
+        """
+        Fetches a copy of the cached payload for a token, if present and not expired
+
+        :param token: Raw token to look up
+        :type token: Union[bytes, str]
+
+        :returns: Cached payload, or ``None`` on a miss
+        :rtype: Optional[dict]
+        """
+        key = self._key(token)
+        entry: Optional[tuple] = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, data = entry
+        if expires_at < time.time():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return dict(data)
+
+    def set(self, token: Union[bytes, str], data: dict) -> None:
+        """
+        Stores a copy of a verified token payload
+
+        :param token: Raw token the payload was extracted from
+        :type token: Union[bytes, str]
+        :param data: Verified payload of the token
+        :type data: dict
+        """
+        key = self._key(token)
+        expires_at = data["exp"]
+        if self.ttl is not None:
+            expires_at = min(expires_at, time.time() + self.ttl)
+        self._data[key] = (expires_at, dict(data))
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drops all cached payloads"""
+        self._data.clear()
+
+
+def get_request(request: Optional[Request] = None) -> Request:
     """Get current Sanic Request"""
     try:
         if not request:
@@ -88,7 +212,7 @@ def normalize_rbac(rbac_dump: dict) -> dict:
     return _inversed
 
 
-async def is_valid_json(data: str) -> Any:
+def is_valid_json(data: str) -> Any:
     """
     Simple helper to validate if a value is valid json data
 
@@ -99,7 +223,7 @@ async def is_valid_json(data: str) -> Any:
     :rtype: bool
     """
     try:
-        return ujson.loads(data)
+        return json_serializer.loads(data)
     except (ValueError, TypeError):
         return False
 
@@ -124,18 +248,7 @@ def duration_from_string(text: str) -> pendulum.Duration:
     text = text.replace(" ", "")
     text = text.replace(",", "")
     text = text.lower()
-    match = re.match(
-        r"""
-            ((?P<years>\d+)y[a-z]*)?
-            ((?P<months>\d+)mo[a-z]*)?
-            ((?P<days>\d+)d[a-z]*)?
-            ((?P<hours>\d+)h[a-z]*)?
-            ((?P<minutes>\d+)m[a-z]*)?
-            ((?P<seconds>\d+)s[a-z]*)?
-        """,
-        text,
-        re.VERBOSE,
-    )
+    match = _DURATION_RE.match(text)
     ConfigurationError.require_condition(
         match,
         f"Couldn't parse {text}",
@@ -177,82 +290,97 @@ def current_guard(ctx: Union[Sanic, SimpleNamespace, None] = None) -> "BeskarTyp
     return guard
 
 
-def app_context_has_token_data(ctx: Optional[Sanic] = None) -> bool:
+def app_context_has_token_data(request: Optional[Request] = None) -> bool:
     """
-    Checks if there is already token_data added to the app context
+    Checks if there is already token_data added to the request context
 
-    :param ctx: Application Context
-    :type ctx: Optional[Sanic]
+    :param request: Sanic request, defaults to the current request
+    :type request: Optional[Request]
 
     :returns: ``True``, ``False``
     :rtype: bool
     """
-    if not ctx:
-        ctx = Sanic.get_app().ctx
+    ctx = get_request(request).ctx
 
-    return hasattr(ctx, "token_data")
+    return getattr(ctx, "token_data", None) is not None
 
 
-def add_token_data_to_app_context(token_data: dict) -> None:
+def add_token_data_to_app_context(token_data: dict, request: Optional[Request] = None) -> None:
     """
     Adds a dictionary of token data (presumably unpacked from a token) to the
-    top of the sanic app's context
+    context of the sanic request, so it lives only as long as the request does
 
     :param token_data: ``dict`` of token data to add
     :type token_data: dict
+    :param request: Sanic request, defaults to the current request
+    :type request: Optional[Request]
     """
-    ctx = Sanic.get_app().ctx
+    ctx = get_request(request).ctx
     ctx.token_data = token_data
+    ctx.token_rolenames = None
+    ctx.token_user = None
 
 
-def get_token_data_from_app_context() -> dict:
+def get_token_data_from_app_context(request: Optional[Request] = None) -> dict:
     """
-    Fetches a dict of token data from the top of the sanic app's context
+    Fetches a dict of token data from the context of the sanic request
 
-    :returns: Token ``dict`` found in current app context
+    :param request: Sanic request, defaults to the current request
+    :type request: Optional[Request]
+
+    :returns: Token ``dict`` found in the request context
     :rtype: dict
     :raises: :py:exc:`~sanic_beskar.BeskarError` on missing token
     """
-    ctx = Sanic.get_app().ctx
-    token_data = getattr(ctx, "token_data", {})
-    BeskarError.require_condition(
-        token_data is not {},
-        """
-        No token_data found in app context.
-        Make sure @auth_required decorator is specified *first* for route
-        """,
-    )
+    ctx = get_request(request).ctx
+    token_data = getattr(ctx, "token_data", None)
+    if token_data is None:
+        raise BeskarError(
+            """
+            No token_data found in request context.
+            Make sure @auth_required decorator is specified *first* for route
+            """
+        )
     return token_data
 
 
-def remove_token_data_from_app_context() -> None:
+def remove_token_data_from_app_context(request: Optional[Request] = None) -> None:
     """
-    Removes the dict of token data from the top of the sanic app's context
+    Removes the dict of token data from the context of the sanic request
+
+    .. note:: This is not required at the end of a request, as the token
+              data goes away with the request it is attached to.
+
+    :param request: Sanic request, defaults to the current request
+    :type request: Optional[Request]
     """
-    ctx = Sanic.get_app().ctx
-    if app_context_has_token_data(ctx):
+    ctx = get_request(request).ctx
+    if getattr(ctx, "token_data", None) is not None:
         del ctx.token_data
+    ctx.token_rolenames = None
+    ctx.token_user = None
 
 
-def current_user_id() -> Union[str, None]:
+def current_user_id(request: Optional[Request] = None) -> Union[str, None]:
     """
     This method returns the user id retrieved from token data attached to
-    the current sanic app's context
+    the sanic request's context
+
+    :param request: Sanic request, defaults to the current request
+    :type request: Optional[Request]
 
     :returns: ``id`` of current :py:class:`User`, if any
     :rtype: str
     :raises: :py:exc:`~sanic_beskar.BeskarError` if no user/token found
     """
-    token_data = get_token_data_from_app_context()
+    token_data = get_token_data_from_app_context(request)
     user_id: str = token_data.get("id", None)
-    BeskarError.require_condition(
-        user_id is not None,
-        "Could not fetch an id for the current user",
-    )
+    if user_id is None:
+        raise BeskarError("Could not fetch an id for the current user")
     return user_id
 
 
-async def generate_totp_qr(user_totp: str) -> "QRCode":
+def generate_totp_qr(user_totp: str) -> "QRCode":
     """
     This is a helper utility to generate a :py:mod:`segno`
     QR code renderer, based upon a supplied `User` TOTP value.
@@ -271,49 +399,80 @@ async def generate_totp_qr(user_totp: str) -> "QRCode":
             "but you didn't install the necessary `segno` library!"
         ) from e
 
-    return segno.make(user_totp)
+    # Fix everything but the version up front, so segno doesn't search for
+    #   an encoding mode, error level or the best scoring mask every time
+    return segno.make(
+        user_totp,
+        error="m",
+        mode="byte",
+        mask=0,
+        micro=False,
+        boost_error=False,
+    )
 
 
-async def current_user() -> Any:
+async def current_user(request: Optional[Request] = None) -> Any:
     """
     This method returns a user instance for token data attached to the
-    current sanic app's context
+    sanic request's context
+
+    The identified user is kept alongside the token data, so repeat calls
+    within the same request don't hit the database again.
+
+    :param request: Sanic request, defaults to the current request
+    :type request: Optional[Request]
 
     :returns: Current logged in ``User`` object
     :rtype: populated :py:attr:`user_class` attribute of the logged in :py:class:`~sanic_beskar.Beskar` instance
     :raises: :py:exc:`~sanic_beskar.BeskarError` if no user identified
     """
-    user_id = current_user_id()
-    guard = current_guard()
-    user = await guard.user_class.identify(user_id)
-    BeskarError.require_condition(
-        user is not None,
-        "Could not identify the current user from the current id",
-    )
+    req = get_request(request)
+    user = getattr(req.ctx, "token_user", None)
+    if user is None:
+        user_id = current_user_id(req)
+        guard = current_guard(req.app)
+        user = await guard.user_class.identify(user_id)
+        if user is None:
+            raise BeskarError("Could not identify the current user from the current id")
+        req.ctx.token_user = user
     return user
 
 
-async def current_rolenames() -> set:
+async def current_rolenames(request: Optional[Request] = None) -> frozenset:
     """
     This method returns the names of all roles associated with the current user
 
+    The parsed roles are kept alongside the token data, so repeat calls for
+    the same token (ie, stacked role decorators) don't parse them again.
+
+    :param request: Sanic request, defaults to the current request
+    :type request: Optional[Request]
+
     :returns: Set of roles for currently logged in users
-    :rtype: set
+    :rtype: frozenset
     """
-    token_data = get_token_data_from_app_context()
-    if "rls" not in token_data:
-        # This is necessary so our set arithmetic works correctly
-        return set(["non-empty-but-definitely-not-matching-subset"])
+    ctx = get_request(request).ctx
+    rolenames: Optional[frozenset] = getattr(ctx, "token_rolenames", None)
+    if rolenames is None:
+        token_data = get_token_data_from_app_context(request)
+        if "rls" not in token_data:
+            rolenames = _NO_ROLENAMES
+        else:
+            rolenames = frozenset(map(str.strip, token_data["rls"].split(",")))
+        ctx.token_rolenames = rolenames
 
-    return set(r.strip() for r in token_data["rls"].split(","))
+    return rolenames
 
 
-def current_custom_claims() -> dict:
+def current_custom_claims(request: Optional[Request] = None) -> dict:
     """
     This method returns any custom claims in the current token
 
+    :param request: Sanic request, defaults to the current request
+    :type request: Optional[Request]
+
     :returns: Custom claims for currently logged in user
     :rtype: dict
     """
-    token_data = get_token_data_from_app_context()
-    return {k: v for (k, v) in token_data.items() if k not in RESERVED_CLAIMS}
+    token_data = get_token_data_from_app_context(request)
+    return {k: v for k, v in token_data.items() if k not in RESERVED_CLAIMS}
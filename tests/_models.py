@@ -1,6 +1,7 @@
 from typing import Optional
 
 from beanie import Indexed
+from beanie.operators import In
 from mongomock_motor import AsyncMongoMockClient  # type: ignore[import-untyped]
 from pydantic import Field as pydantic_field
 from sanic_beskar.orm import BeanieUserMixin, TortoiseUserMixin, UmongoUserMixin
@@ -35,6 +36,11 @@ class MixinUserTortoise(TortoiseUserMixin):
         """``tortoise`` document create caller"""
         return await cls.create(**kwargs)
 
+    @classmethod
+    async def cls_delete_many(cls, ids: list):
+        """``tortoise`` bulk delete caller"""
+        await cls.filter(id__in=ids).delete()
+
 
 class MixinUserBeanie(BeanieUserMixin):
     """
@@ -54,6 +60,11 @@ class MixinUserBeanie(BeanieUserMixin):
         """``beanie`` document create caller"""
         return await cls(**kwargs).insert()
 
+    @classmethod
+    async def cls_delete_many(cls, ids: list):
+        """``beanie`` bulk delete caller"""
+        await cls.find(In(cls.id, ids)).delete()
+
 
 umongo_instance.register(UmongoUserMixin)
 
@@ -77,6 +88,11 @@ class MixinUserUmongo(UmongoDocument, UmongoUserMixin):
         _user = await cls(**kwargs).commit()
         return await cls.find_one({"id": _user.inserted_id})
 
+    @classmethod
+    async def cls_delete_many(cls, ids: list):
+        """``umongo`` bulk delete caller"""
+        await cls.collection.delete_many({"_id": {"$in": ids}})
+
 
 class ValidatingUser(BeanieUserMixin):
     """
@@ -96,6 +112,11 @@ class ValidatingUser(BeanieUserMixin):
         """``beanie`` document create caller"""
         return await cls(**kwargs).insert()
 
+    @classmethod
+    async def cls_delete_many(cls, ids: list):
+        """``beanie`` bulk delete caller"""
+        await cls.find(In(cls.id, ids)).delete()
+
     def is_valid(self):
         """return `is_active` logic"""
         return self.is_active
@@ -5,16 +5,18 @@ import uvloop
 asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 import copy
-import warnings
+import logging
+import os
 from typing import Any
 
 import async_sender  # type: ignore
+import orjson
 import pytest
 import sanic_beskar
 from async_sender import Mail
 from beanie import init_beanie
 from mongomock_motor import AsyncMongoMockClient  # type: ignore[import-untyped]
-from sanic import Sanic, json
+from sanic import Sanic, json, raw
 from sanic.exceptions import SanicException
 from sanic.views import HTTPMethodView
 from sanic_beskar.base import Beskar
@@ -22,8 +24,6 @@ from sanic_beskar.exceptions import BeskarError
 from sanic_testing import TestManager  # type: ignore
 from tortoise import Tortoise
 from tortoise.contrib.test import _init_db, getDBConfig
-from ujson import dumps as ujson_dumps
-from ujson import loads as ujson_loads
 
 from tests._models import MixinUserBeanie, TotpUser, ValidatingUser
 
@@ -31,35 +31,51 @@ _guard = Beskar()
 _mail = Mail()
 
 
-@pytest.fixture(params=["jwt", "paseto"])
-async def app(request, monkeypatch):
+# Body returned by the trivial test routes, serialized once up front
+_SUCCESS_BODY = orjson.dumps({"message": "success"})
+
+# Role combinations used by the test routes
+_ADMIN_ROLES = ("admin",)
+_ADMIN_OPERATOR_ROLES = ("admin", "operator")
+
+_RBAC_DEFINITIONS = {
+    "sooper_access_right": ["admin", "uber_admin"],
+    "lame_access_right": ["not_admin"],
+}
+
+
+@pytest.fixture(scope="session", params=["jwt", "paseto"])
+async def app(request):
     """
     Sanic App instance for unit testing
+
+    Initializes the sanic app for the test suite. Also prepares a set of routes
+    to use in testing with varying levels of protections.
+
+    Built once per token provider and shared by the tests using it; per test
+    state is reset by :py:func:`default_guard_state` and
+    :py:func:`clean_sanic_app_config`.
     """
 
     # Use the fixture params to test all our token providers
-    monkeypatch.setenv("SANIC_BESKAR_TOKEN_PROVIDER", request.param)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("SANIC_BESKAR_TOKEN_PROVIDER", request.param)
+        sanic_app = Sanic("sanic-testing", dumps=orjson.dumps, loads=orjson.loads)
 
-    """
-    Initializes the sanic app for the test suite. Also prepares a set of routes
-    to use in testing with varying levels of protections
-    """
-    sanic_app = Sanic("sanic-testing", dumps=ujson_dumps, loads=ujson_loads)
-    # In order to process more requests after initializing the app,
-    # we have to set degug to false so that it will not check to see if there
-    # has already been a request before a setup function
-    sanic_app.state.mode = "Mode.DEBUG"
+    # Access logging only adds overhead (and noise) to every test request
+    sanic_app.config.ACCESS_LOG = False
     sanic_app.config.TESTING = True
     sanic_app.config["PYTESTING"] = True
     sanic_app.config.SECRET_KEY = "top secret 4nd comPLex radness!!"
+    # Hashing strength doesn't matter here, and is the bulk of most tests' runtime.
+    #   Schemes still round trip normally, so authentication is tested all the same.
+    sanic_app.config.BESKAR_HASH_SETTINGS = {
+        "pbkdf2_sha512__default_rounds": 1,
+        "bcrypt__default_rounds": 4,
+    }
 
     sanic_app.config.FALLBACK_ERROR_FORMAT = "json"
 
-    _guard.init_app(sanic_app, MixinUserBeanie)
-    _guard.rbac_definitions = {
-        "sooper_access_right": ["admin", "uber_admin"],
-        "lame_access_right": ["not_admin"],
-    }
     sanic_app.ctx.mail = _mail
 
     @sanic_app.route("/unprotected")
@@ -67,7 +83,7 @@ async def app(request, monkeypatch):
         """
         Endpoint without any security decorators
         """
-        return json({"message": "success"})
+        return raw(_SUCCESS_BODY, content_type="application/json")
 
     @sanic_app.route("/kinda_protected")
     @sanic_beskar.auth_accepted
@@ -91,7 +107,7 @@ async def app(request, monkeypatch):
             """
             Endpoint that requires an authentication header, via `class` based setup
             """
-            return json({"message": "success"})
+            return raw(_SUCCESS_BODY, content_type="application/json")
 
     sanic_app.add_route(ProtectedView.as_view(), "/protected_class")
 
@@ -101,7 +117,7 @@ async def app(request, monkeypatch):
         """
         Endpoint requiring basic authentication header
         """
-        return json({"message": "success"})
+        return raw(_SUCCESS_BODY, content_type="application/json")
 
     @sanic_app.route("/rbac_protected")
     @sanic_beskar.auth_required
@@ -110,59 +126,59 @@ async def app(request, monkeypatch):
         """
         Endpoint looking for `sooper_access_right` RBAC rights
         """
-        return json({"message": "success"})
+        return raw(_SUCCESS_BODY, content_type="application/json")
 
     @sanic_app.route("/protected_admin_required")
     @sanic_beskar.auth_required
-    @sanic_beskar.roles_required("admin")
+    @sanic_beskar.roles_required(*_ADMIN_ROLES)
     async def protected_admin_required(request):
         """
         Endpoint requiring the user has an 'admin' role
         """
-        return json({"message": "success"})
+        return raw(_SUCCESS_BODY, content_type="application/json")
 
     @sanic_app.route("/protected_admin_and_operator_required")
     @sanic_beskar.auth_required
-    @sanic_beskar.roles_required("admin", "operator")
+    @sanic_beskar.roles_required(*_ADMIN_OPERATOR_ROLES)
     async def protected_admin_and_operator_required(request):
         """
         Endpoint requiring both 'admin' and 'operator' roles
         """
-        return json({"message": "success"})
+        return raw(_SUCCESS_BODY, content_type="application/json")
 
     @sanic_app.route("/protected_admin_and_operator_accepted")
     @sanic_beskar.auth_required
-    @sanic_beskar.roles_accepted("admin", "operator")
+    @sanic_beskar.roles_accepted(*_ADMIN_OPERATOR_ROLES)
     async def protected_admin_and_operator_accepted(request):
         """
         endpoint that requires 'admin' *and*/*or* 'operator' role
         """
-        return json({"message": "success"})
+        return raw(_SUCCESS_BODY, content_type="application/json")
 
     @sanic_app.route("/undecorated_admin_required")
-    @sanic_beskar.roles_required("admin")
+    @sanic_beskar.roles_required(*_ADMIN_ROLES)
     async def undecorated_admin_required(request):
         """
         Endpoint that doesn't use both decorators (which is supported)
         """
-        return json({"message": "success"})
+        return raw(_SUCCESS_BODY, content_type="application/json")
 
     @sanic_app.route("/undecorated_admin_accepted")
-    @sanic_beskar.roles_accepted("admin")
+    @sanic_beskar.roles_accepted(*_ADMIN_ROLES)
     async def undecorated_admin_accepted(request):
         """
         Endpoint that doesn't use both decorators (which is supported)
         """
-        return json({"message": "success"})
+        return raw(_SUCCESS_BODY, content_type="application/json")
 
     @sanic_app.route("/reversed_decorators")
-    @sanic_beskar.roles_required("admin", "operator")
+    @sanic_beskar.roles_required(*_ADMIN_OPERATOR_ROLES)
     @sanic_beskar.auth_required
     async def reversed_decorators(request):
         """
         Endpoint with decorators in a different order (which is supported)
         """
-        return json({"message": "success"})
+        return raw(_SUCCESS_BODY, content_type="application/json")
 
     @sanic_app.route("/registration_confirmation")
     def reg_confirm(request):
@@ -173,20 +189,15 @@ async def app(request, monkeypatch):
 
     TestManager(sanic_app)
 
-    # Init beanie
-    client = AsyncMongoMockClient()
-    await init_beanie(database=client.db_name, document_models=[MixinUserBeanie])
-
-    import logging
-
-    logging.basicConfig(level=logging.DEBUG)
+    # Verbose logging is opt-in, as it slows down every request
+    if os.environ.get("BESKAR_TEST_DEBUG"):
+        logging.basicConfig(level=logging.DEBUG)
 
     # register_tortoise(
     #    sanic_app, db_url="sqlite://:memory:", modules={"models": ["tests._models"]}, generate_schemas=True
     # )
 
-    return sanic_app
-    # Sanic._app_registry.clear()
+    yield sanic_app
 
 
 @pytest.fixture(scope="session")
@@ -237,6 +248,21 @@ def mail():
     return _mail
 
 
+@pytest.fixture(autouse=True)
+async def default_guard_state(app: Sanic, clean_sanic_app_config):
+    """
+    This fixture (re)initializes the shared guard against the shared app for
+        each test, as tests are free to reconfigure it, or to init other
+        guards against the app. Each test also gets a fresh `beanie` database.
+    """
+    _guard.init_app(app, MixinUserBeanie)
+    _guard.rbac_definitions = copy.deepcopy(_RBAC_DEFINITIONS)
+
+    client = AsyncMongoMockClient()
+    await init_beanie(database=client.db_name, document_models=[MixinUserBeanie])
+    yield
+
+
 @pytest.fixture(autouse=True)
 def clean_sanic_app_config(app: Sanic):
     """
@@ -257,10 +283,14 @@ def client(app):
 
 
 @pytest.fixture()
-def mock_users(user_class, default_guard):
+async def mock_users(user_class, default_guard):
     """
     Fixture to hold generator for test users for unit testing
+
+    Users created are removed when the test finishes, with a single
+    bulk delete per user class.
     """
+    created: dict = {}
 
     async def _get_user(
         username: str, class_name: Any = user_class, guard_name: Any = default_guard, **kwargs
@@ -293,7 +323,7 @@ def mock_users(user_class, default_guard):
 
         # TODO: This is ugly, gotta be a nicer way
         if kwargs.get("id"):
-            return await class_name.cls_create(
+            user = await class_name.cls_create(
                 username=username,
                 email=email,
                 password=password,
@@ -301,8 +331,8 @@ def mock_users(user_class, default_guard):
                 is_active=kwargs.get("is_active", True),
                 id=kwargs["id"],
             )
-        if kwargs.get("totp"):
-            return await class_name.cls_create(
+        elif kwargs.get("totp"):
+            user = await class_name.cls_create(
                 username=username,
                 email=email,
                 password=password,
@@ -311,7 +341,7 @@ def mock_users(user_class, default_guard):
                 totp=kwargs.get("totp"),
             )
         else:
-            return await class_name.cls_create(
+            user = await class_name.cls_create(
                 username=username,
                 email=email,
                 password=password,
@@ -319,7 +349,13 @@ def mock_users(user_class, default_guard):
                 is_active=kwargs.get("is_active", True),
             )
 
-    return _get_user
+        created.setdefault(class_name, []).append(user.id)
+        return user
+
+    yield _get_user
+
+    for class_name, ids in created.items():
+        await class_name.cls_delete_many(ids)
 
 
 @pytest.fixture(autouse=False)
@@ -351,18 +387,6 @@ def no_email_sending(monkeypatch):
     monkeypatch.setattr(async_sender.api.Mail, "send_message", _mock_send_message)
 
 
-@pytest.fixture(autouse=True)
-def speed_up_passlib_for_pytest_only(default_guard):
-    """
-    Fixture to lower down the hashing rounds simply to speed up unit testing where
-    the strength doesn't matter.
-    """
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        default_guard.pwd_ctx.update(pkdbf2_sha512__default_rounds=1)
-        default_guard.pwd_ctx.update(bcrypt__default_rounds=1)
-
-
 @pytest.fixture(scope="session", autouse=False)
 async def in_memory_tortoise_db(request):
     """
@@ -373,6 +397,17 @@ async def in_memory_tortoise_db(request):
     """
     config = getDBConfig(app_label="models", modules=["tests._models"])
 
+    # The test DB is throw away, so skip the journaling and syncing sqlite would do
+    #   for durability. `tortoise` issues these as PRAGMAs on connect.
+    connection = config["connections"]["models"]
+    if connection["engine"] == "tortoise.backends.sqlite":
+        connection["credentials"].update(
+            journal_mode="MEMORY",
+            synchronous="OFF",
+            temp_store="MEMORY",
+            locking_mode="EXCLUSIVE",
+        )
+
     await _init_db(config)
 
     request.addfinalizer(lambda: asyncio.run(Tortoise._drop_databases()))
@@ -80,6 +80,29 @@ class TestBeskar:
         assert specified_guard._verify_password("some password", secret)
         assert not specified_guard._verify_password("not right", secret)
 
+    async def test_argon2_hash_settings(self, app, user_class):
+        """
+        test_argon2_hash_settings
+
+        This test verifies that the ``argon2`` scheme defaults to the tuned
+        Argon2id settings, and that ``BESKAR_HASH_SETTINGS`` may override them.
+        """
+        app.config["BESKAR_HASH_SCHEME"] = "argon2"
+        argon2_guard = Beskar(app, user_class)
+        secret = argon2_guard.hash_password("some password")
+        assert secret.startswith("$argon2id$v=19$m=65536,t=2,p=1$")
+        assert argon2_guard._verify_password("some password", secret)
+
+        app.config["BESKAR_HASH_SETTINGS"] = {"argon2__time_cost": 1, "argon2__memory_cost": 1024}
+        argon2_guard = Beskar(app, user_class)
+        secret = argon2_guard.hash_password("some password")
+        assert secret.startswith("$argon2id$v=19$m=1024,t=1,p=1$")
+
+        app.config["BESKAR_HASH_ALLOWED_SCHEMES"] = ["argon2"]
+        app.config["BESKAR_HASH_SETTINGS"] = {"bcrypt__rounds": 4}
+        argon2_guard = Beskar(app, user_class)
+        assert argon2_guard.pwd_ctx.schemes() == ("argon2",)
+
     async def test_authenticate(self, user_class, default_guard, mock_users):
         """
         test_authenticate
@@ -734,6 +757,73 @@ class TestBeskar:
         await brandt.delete()
         await bunny.delete()
 
+    async def test_extract_token_cache(self, app, user_class, mock_users, monkeypatch):
+        """
+        test_extract_token_cache
+
+        This test verifies that, when ``BESKAR_TOKEN_CACHE_ENABLED`` is set, an
+        access token is only verified once, that cached claims are still validated
+        on every use, and that callers get their own copy of the claims.
+        """
+        the_dude = await mock_users(username="the_dude", password="abides", roles="admin")
+
+        app.config.BESKAR_TOKEN_CACHE_ENABLED = True
+        cached_guard = Beskar(app, user_class)
+        assert cached_guard.token_cache is not None
+
+        moment = plummet.momentize("2017-05-21 18:39:55")
+        with plummet.frozen_time(moment):
+            token = await cached_guard.encode_token(the_dude)
+            token_data = await cached_guard.extract_token(token)
+            assert len(cached_guard.token_cache) == 1
+
+            async def _no_verify(*args, **kwargs):
+                """token should never be decoded again"""
+                raise AssertionError("cached token was verified again")
+
+            monkeypatch.setattr(
+                cached_guard, f"extract_{cached_guard.token_provider}_token", _no_verify
+            )
+            token_data["id"] = "not_the_dude"
+            cached_data = await cached_guard.extract_token(token)
+            assert cached_data["id"] == the_dude.identity
+            assert cached_data["rls"] == "admin"
+
+            cached_guard.is_blacklisted = lambda jti: jti == cached_data["jti"]
+            with pytest.raises(BlacklistedError):
+                await cached_guard.extract_token(token)
+
+        await the_dude.delete()
+
+    async def test_extract_token_cache_ttl(self, app, user_class, mock_users):
+        """
+        test_extract_token_cache_ttl
+
+        This test verifies that ``BESKAR_TOKEN_CACHE_TTL`` bounds how long a
+        verified token is cached, independent of the token's own expiration.
+        """
+        the_dude = await mock_users(username="the_dude", password="abides")
+
+        app.config.BESKAR_TOKEN_CACHE_ENABLED = True
+        app.config.BESKAR_TOKEN_CACHE_TTL = 30
+        cached_guard = Beskar(app, user_class)
+        assert cached_guard.token_cache.ttl == 30
+
+        moment = plummet.momentize("2017-05-21 18:39:55")
+        with plummet.frozen_time(moment):
+            token = await cached_guard.encode_token(the_dude)
+            await cached_guard.extract_token(token)
+            assert cached_guard.token_cache.get(token) is not None
+
+        with plummet.frozen_time(moment.add(seconds=29)):
+            assert cached_guard.token_cache.get(token) is not None
+
+        with plummet.frozen_time(moment.add(seconds=31)):
+            assert cached_guard.token_cache.get(token) is None
+            assert len(cached_guard.token_cache) == 0
+
+        await the_dude.delete()
+
     async def test_read_token_from_header(self, client, mock_users, default_guard):
         """
         test_read_token_from_header
@@ -4,7 +4,8 @@ import warnings
 import pendulum
 import plummet  # type: ignore
 from httpx import Cookies
-from sanic_beskar import Beskar
+from sanic import Sanic, json
+from sanic_beskar import Beskar, auth_required
 from sanic_beskar.exceptions import MissingRightError, MissingRoleError
 
 
@@ -63,6 +64,49 @@ class TestBeskarDecorators:
             assert response.json["user"] == the_dude.username
         await the_dude.delete()
 
+    async def test_auth_required_multiple_apps(self, user_class, mock_users):
+        """
+        test_auth_required_multiple_apps
+
+        This test verifies that, with several apps (and guards) in the same
+        process, a protected route is verified by its own app's guard, and
+        a token issued by another app's guard is refused.
+        """
+
+        the_dude = await mock_users(username="the_dude")
+
+        app_a = Sanic("sanic-testing-a")
+        app_b = Sanic("sanic-testing-b")
+        try:
+            app_a.config.SECRET_KEY = "app A's very own secret, 32+ chars long"
+            app_b.config.SECRET_KEY = "app B's very own secret, 32+ chars long"
+            app_a.config.FALLBACK_ERROR_FORMAT = "json"
+            guard_a = Beskar(app_a, user_class)
+            guard_b = Beskar(app_b, user_class)
+
+            @app_a.route("/protected")
+            @auth_required
+            async def protected(request):
+                """
+                Endpoint that requires an authentication header, on app A
+                """
+                return json({"message": "success"})
+
+            _, response = await app_a.asgi_client.get(
+                "/protected",
+                headers=await guard_b.pack_header_for_user(the_dude),
+            )
+            assert response.status == 401
+
+            _, response = await app_a.asgi_client.get(
+                "/protected",
+                headers=await guard_a.pack_header_for_user(the_dude),
+            )
+            assert response.status == 200
+        finally:
+            Sanic.unregister_app(app_a)
+            Sanic.unregister_app(app_b)
+
     async def test_auth_required(self, default_guard, mock_users, client):
         """
         test_auth_required
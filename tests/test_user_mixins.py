@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 import sanic_beskar
 import sanic_beskar.exceptions
@@ -10,6 +12,18 @@ from tests._models import MixinUserBeanie, MixinUserTortoise, MixinUserUmongo
 ALL_MIXIN_MODELS = [MixinUserBeanie, MixinUserUmongo, MixinUserTortoise]
 
 
+async def expect_error(coro, err_type):
+    """
+    Awaits ``coro``, asserting it raises ``err_type``
+
+    Returns:
+        Exception: The exception raised, for further inspection
+    """
+    with pytest.raises(err_type) as e:
+        await coro
+    return e.value
+
+
 class TestUserMixin:
     """
     Unit tests for the ``sanic_beskar.orm`` included mixins
@@ -36,7 +50,6 @@ class TestUserMixin:
             await mixin_guard.authenticate("the_bro", "abides")
         with pytest.raises(sanic_beskar.exceptions.AuthenticationError):
             await mixin_guard.authenticate("the_dude", "is_undudelike")
-        await the_dude.delete()
 
     @pytest.mark.parametrize("mixin_user", ALL_MIXIN_MODELS)
     async def test_no_rolenames(self, app, mixin_user, mock_users, in_memory_tortoise_db):
@@ -55,7 +68,6 @@ class TestUserMixin:
         )
 
         assert the_noroles_dude.rolenames == []
-        await the_noroles_dude.delete()
 
     @pytest.mark.parametrize("mixin_user", ALL_MIXIN_MODELS)
     async def test_lookups(self, app, mixin_user, mock_users, in_memory_tortoise_db):
@@ -74,23 +86,38 @@ class TestUserMixin:
             class_name=mixin_user,
         )
 
-        assert await mixin_user.lookup(email="the_dude@mock.com") == the_dude
-        assert await mixin_user.lookup(username="the_dude") == the_dude
-        assert await mixin_user.lookup() is None
-        assert await mixin_user.identify(id=the_dude.id) == the_dude
         fake_id = 999999999
         if isinstance(the_dude.id, ObjectId):
             fake_id = ObjectId()
-        assert await mixin_user.identify(id=fake_id) is None
-        assert await mixin_user.lookup(username=fake_id) is None
+
+        # These lookups are all independent of each other, so run them concurrently
+        (
+            by_email,
+            by_username,
+            by_nothing,
+            by_id,
+            by_fake_id,
+            by_fake_username,
+        ) = await asyncio.gather(
+            mixin_user.lookup(email="the_dude@mock.com"),
+            mixin_user.lookup(username="the_dude"),
+            mixin_user.lookup(),
+            mixin_user.identify(id=the_dude.id),
+            mixin_user.identify(id=fake_id),
+            mixin_user.lookup(username=fake_id),
+        )
+        assert by_email == the_dude
+        assert by_username == the_dude
+        assert by_nothing is None
+        assert by_id == the_dude
+        assert by_fake_id is None
+        assert by_fake_username is None
 
         if isinstance(the_dude.id, ObjectId):
             assert str(the_dude.identity) == str(the_dude.id)
         else:
             assert the_dude.identity == the_dude.id
 
-        await the_dude.delete()
-
     async def test_totp(self, app, totp_user_class, mock_users):
         """
         test_totp
@@ -109,29 +136,30 @@ class TestUserMixin:
         assert the_dude.totp == "mock"
         assert app.config.get("BESKAR_TOTP_ENFORCE", True) is True
 
-        # good creds, missing TOTP
-        with pytest.raises(sanic_beskar.exceptions.AuthenticationError) as e:
-            await totp_guard.authenticate("the_dude", "abides")
-        assert e.type is sanic_beskar.exceptions.TOTPRequired
-
-        # bad creds
-        with pytest.raises(sanic_beskar.exceptions.AuthenticationError) as e:
-            await totp_guard.authenticate("the_dude", "is_undudelike")
-        assert e.type is not sanic_beskar.exceptions.TOTPRequired
-
-        # bad token
-        with pytest.raises(sanic_beskar.exceptions.AuthenticationError):
-            await totp_guard.authenticate_totp("the_dude", 80085)
-
-        # good creds, bad token
-        with pytest.raises(sanic_beskar.exceptions.AuthenticationError) as e:
-            await totp_guard.authenticate("the_dude", "abides", 80085)
-        assert e.type is not sanic_beskar.exceptions.TOTPRequired
-
-        # bad creds, bad token
-        with pytest.raises(sanic_beskar.exceptions.AuthenticationError) as e:
-            await totp_guard.authenticate("the_dude", "is_undudelike", 80085)
-        assert e.type is not sanic_beskar.exceptions.TOTPRequired
+        # These failures are all independent of each other, so check them concurrently
+        auth_error = sanic_beskar.exceptions.AuthenticationError
+        (
+            missing_totp,
+            bad_creds,
+            _bad_token,
+            bad_token_good_creds,
+            bad_token_bad_creds,
+        ) = await asyncio.gather(
+            # good creds, missing TOTP
+            expect_error(totp_guard.authenticate("the_dude", "abides"), auth_error),
+            # bad creds
+            expect_error(totp_guard.authenticate("the_dude", "is_undudelike"), auth_error),
+            # bad token
+            expect_error(totp_guard.authenticate_totp("the_dude", 80085), auth_error),
+            # good creds, bad token
+            expect_error(totp_guard.authenticate("the_dude", "abides", 80085), auth_error),
+            # bad creds, bad token
+            expect_error(totp_guard.authenticate("the_dude", "is_undudelike", 80085), auth_error),
+        )
+        assert type(missing_totp) is sanic_beskar.exceptions.TOTPRequired
+        assert type(bad_creds) is not sanic_beskar.exceptions.TOTPRequired
+        assert type(bad_token_good_creds) is not sanic_beskar.exceptions.TOTPRequired
+        assert type(bad_token_bad_creds) is not sanic_beskar.exceptions.TOTPRequired
 
         """
         Verify its ok to call `authenticate` w/o a `token`, for a required user,
@@ -142,5 +170,3 @@ class TestUserMixin:
         # good creds, missing TOTP
         _optional_the_dude = await _totp_optional_guard.authenticate("the_dude", "abides")
         assert _optional_the_dude == the_dude
-
-        await the_dude.delete()
@@ -1,14 +1,17 @@
 from io import BytesIO, StringIO
 
+import jwt
 import pendulum
 import pytest
 from bson import ObjectId
 from sanic import Sanic
+from sanic_beskar import Beskar
 from sanic_beskar.exceptions import (
     BeskarError,
     ConfigurationError,
 )
 from sanic_beskar.utilities import (
+    SerializerPyJWT,
     add_token_data_to_app_context,
     app_context_has_token_data,
     current_custom_claims,
@@ -31,98 +34,113 @@ class TestBeskarUtilities:
     Unit tests against ``sanic_beskar.utilities``
     """
 
-    def test_app_context_has_token_data(self):
+    async def test_app_context_has_token_data(self, client):
         """
         This test verifies that the app_context_has_token_data method can
-        determine if token_data has been added to the app context yet
+        determine if token_data has been added to the request context yet
         """
-        assert not app_context_has_token_data()
-        add_token_data_to_app_context({"a": 1})
-        assert app_context_has_token_data()
-        remove_token_data_from_app_context()
-        assert not app_context_has_token_data()
-
-    def test_remove_token_data_from_app_context(self):
+        request, _ = await client.get("/unprotected")
+        assert not app_context_has_token_data(request)
+        add_token_data_to_app_context({"a": 1}, request)
+        assert app_context_has_token_data(request)
+        remove_token_data_from_app_context(request)
+        assert not app_context_has_token_data(request)
+
+    async def test_remove_token_data_from_app_context(self, client):
         """
-        This test verifies that token data can be removed from an app context.
+        This test verifies that token data can be removed from a request context.
         It also verifies that attempting to remove the data if it does not
         exist there does not cause an exception
         """
+        request, _ = await client.get("/unprotected")
         token_data = {"a": 1}
-        add_token_data_to_app_context(token_data)
-        assert Sanic.get_app().ctx.token_data == token_data
-        remove_token_data_from_app_context()
+        add_token_data_to_app_context(token_data, request)
+        assert request.ctx.token_data == token_data
         assert not hasattr(Sanic.get_app().ctx, "token_data")
-        remove_token_data_from_app_context()
+        remove_token_data_from_app_context(request)
+        assert not hasattr(request.ctx, "token_data")
+        remove_token_data_from_app_context(request)
 
-    async def test_current_user_id(self):
+    async def test_current_user_id(self, client):
         """
         This test verifies that the current user id can be successfully
         determined based on token data that has been added to the current
-        sanic app's context.
+        sanic request's context.
         """
+        request, _ = await client.get("/unprotected")
+        with pytest.raises(BeskarError) as err_info:
+            current_user_id(request)
+        assert "No token_data found" in str(err_info.value)
+
         token_data = {}
-        add_token_data_to_app_context(token_data)
+        add_token_data_to_app_context(token_data, request)
         with pytest.raises(BeskarError) as err_info:
-            await current_user()
+            await current_user(request)
         assert "Could not fetch an id" in str(err_info.value)
 
         token_data = {"id": 31}
-        add_token_data_to_app_context(token_data)
-        assert current_user_id() == 31
+        add_token_data_to_app_context(token_data, request)
+        assert current_user_id(request) == 31
 
-    async def test_current_user(self, mock_users):
+    async def test_current_user(self, client, mock_users):
         """
         This test verifies that the current user can be successfully
         determined based on token data that has been added to the current
-        sanic app's context.
+        sanic request's context.
         """
+        request, _ = await client.get("/unprotected")
         token_data = {}
-        add_token_data_to_app_context(token_data)
+        add_token_data_to_app_context(token_data, request)
         with pytest.raises(BeskarError) as err_info:
-            await current_user()
+            await current_user(request)
         assert "Could not fetch an id" in str(err_info.value)
 
         token_data = {"id": ObjectId()}
-        add_token_data_to_app_context(token_data)
+        add_token_data_to_app_context(token_data, request)
         with pytest.raises(BeskarError) as err_info:
-            await current_user()
+            await current_user(request)
         assert "Could not identify the current user" in str(err_info.value)
 
         test_id = ObjectId()
         the_dude = await mock_users(username="the_dude", password="Abides", id=test_id)
         token_data = {"id": test_id}
-        add_token_data_to_app_context(token_data)
-        assert await current_user() == the_dude
+        add_token_data_to_app_context(token_data, request)
+        assert await current_user(request) == the_dude
+        assert (await current_user(request)) is (await current_user(request))
 
-    async def test_current_rolenames(self):
+    async def test_current_rolenames(self, client):
         """
         This test verifies that the rolenames attached to the current user
         can be extracted from the token data that has been added to the
-        current sanic app's context
+        current sanic request's context
         """
+        request, _ = await client.get("/unprotected")
         token_data = {}
-        add_token_data_to_app_context(token_data)
-        assert (await current_rolenames()) == set(["non-empty-but-definitely-not-matching-subset"])
+        add_token_data_to_app_context(token_data, request)
+        assert (await current_rolenames(request)) == set(
+            ["non-empty-but-definitely-not-matching-subset"]
+        )
 
-        token_data = {"rls": "admin,operator"}
-        add_token_data_to_app_context(token_data)
-        assert (await current_rolenames()) == set(["admin", "operator"])
+        token_data = {"rls": "admin, operator"}
+        add_token_data_to_app_context(token_data, request)
+        assert (await current_rolenames(request)) == set(["admin", "operator"])
+        assert (await current_rolenames(request)) is (await current_rolenames(request))
 
-    def test_current_custom_claims(self):
+    async def test_current_custom_claims(self, client):
         """
         This test verifies that any custom claims attached to the current token
         can be extracted from the token data that has been added to the
-        current sanic app's context
+        current sanic request's context
         """
+        request, _ = await client.get("/unprotected")
         token_data = dict(
             id=13,
             jti="whatever",
             duder="brief",
             el_duderino="not brief",
         )
-        add_token_data_to_app_context(token_data)
-        assert current_custom_claims() == dict(
+        add_token_data_to_app_context(token_data, request)
+        assert current_custom_claims(request) == dict(
             duder="brief",
             el_duderino="not brief",
         )
@@ -148,6 +166,10 @@ class TestBeskarUtilities:
         computed_duration = duration_from_string("1mo,2m")
         assert computed_duration == expected_duration
 
+        expected_duration = pendulum.duration(years=1, days=2, seconds=3)
+        computed_duration = duration_from_string(" 1 YEAR, 2 Days ,3Sec ")
+        assert computed_duration == expected_duration
+
     def test_duration_from_string_fails(self):
         """
         This test verifies that the duration_from_string method raises a
@@ -167,7 +189,7 @@ class TestBeskarUtilities:
         png_out = BytesIO()
         txt_out = StringIO()
         totp = default_guard.totp_ctx.new()
-        qrcode = await generate_totp_qr(totp.to_json())
+        qrcode = generate_totp_qr(totp.to_json())
         assert qrcode
 
         qrcode.save(kind="png", out=png_out)
@@ -179,7 +201,7 @@ class TestBeskarUtilities:
         assert isinstance(txt_out, StringIO)
 
         with pytest.raises(TypeError):
-            await generate_totp_qr(None)
+            generate_totp_qr(None)
 
     async def test_rbac_normalization(self):
         """
@@ -209,16 +231,36 @@ class TestBeskarUtilities:
         This test verifies we can identify proper JSON.
         """
 
-        assert await is_valid_json(dumps({"foo": "bar"}))
-        assert not await is_valid_json([None])
-        assert not await is_valid_json({"foo"})
+        assert is_valid_json(dumps({"foo": "bar"}))
+        assert is_valid_json(dumps({"foo": "bar"}).encode())
+        assert not is_valid_json([None])
+        assert not is_valid_json({"foo"})
 
-    async def test_current_guard(self, default_guard):
+    def test_serializer_pyjwt(self):
+        """
+        This test verifies that token payloads decoded with our json
+        serializer match what PyJWT itself would produce.
+        """
+        secret = "a-secret-long-enough-for-hs256-keys"
+        token = jwt.encode({"id": 1, "rls": "admin"}, secret, algorithm="HS256")
+        decoded = SerializerPyJWT().decode(token, secret, algorithms=["HS256"])
+        assert decoded == jwt.decode(token, secret, algorithms=["HS256"])
+
+        bad_token = jwt.api_jws.encode(b"[1, 2]", secret, algorithm="HS256")
+        with pytest.raises(jwt.DecodeError):
+            SerializerPyJWT().decode(bad_token, secret, algorithms=["HS256"])
+
+    async def test_current_guard(self, app, user_class, default_guard):
         """
         This test verifies we get back the proper guard object
         """
 
         assert current_guard() == default_guard
+        assert current_guard(app) == default_guard
+
+        other_guard = Beskar(app, user_class)
+        assert current_guard() == other_guard
+        assert current_guard(app.ctx) == other_guard
 
     async def test_get_request(self):
         """